@@ -6,7 +6,8 @@ from comfy_api.latest import io
 
 from .nodes_profile import S3_PROFILE_TYPE
 from .profile import resolve_default_profile, validate_config
-from .providers import create_s3_client
+from . import providers
+from .providers import get_cached_client
 
 logger = logging.getLogger(__name__)
 
@@ -42,31 +43,29 @@ class ListBucket(io.ComfyNode):
 
     @classmethod
     def execute(cls, prefix="", max_results=100, profile=None) -> io.NodeOutput:
-        from botocore.exceptions import ClientError
-
         config = profile or resolve_default_profile()
         validate_config(config)
-        client = create_s3_client(**config)
+        client = get_cached_client(config)
         bucket = config["bucket"]
 
         full_prefix = f"{config.get('path_prefix', '')}{prefix}"
 
+        # max_results is capped at 1000 (one S3 page), so a single
+        # list_objects_v2 call suffices - no paginator needed.
         try:
-            paginator = client.get_paginator("list_objects_v2")
-            keys = []
-            for page in paginator.paginate(
+            resp = client.list_objects_v2(
                 Bucket=bucket,
                 Prefix=full_prefix,
-                PaginationConfig={"MaxItems": max_results},
-            ):
-                for obj in page.get("Contents", []):
-                    size_mb = obj["Size"] / (1024 * 1024)
-                    keys.append(f"{obj['Key']}  ({size_mb:.1f} MB)")
-        except ClientError as e:
+                MaxKeys=max_results,
+            )
+        except providers.ClientError as e:
             code = e.response["Error"]["Code"]
             raise ValueError(f"S3 error [{code}]: {e.response['Error']['Message']}") from e
 
-        return io.NodeOutput("\n".join(keys))
+        return io.NodeOutput("\n".join(
+            f"{obj['Key']}  ({obj['Size'] / (1024 * 1024):.1f} MB)"
+            for obj in resp.get("Contents", [])
+        ))
 
 
 class GeneratePresignedURL(io.ComfyNode):
@@ -101,11 +100,9 @@ class GeneratePresignedURL(io.ComfyNode):
 
     @classmethod
     def execute(cls, key, expires_hours=24, profile=None) -> io.NodeOutput:
-        from botocore.exceptions import ClientError
-
         config = profile or resolve_default_profile()
         validate_config(config)
-        client = create_s3_client(**config)
+        client = get_cached_client(config)
         bucket = config["bucket"]
 
         full_key = f"{config.get('path_prefix', '')}{key}"
@@ -116,7 +113,7 @@ class GeneratePresignedURL(io.ComfyNode):
                 Params={"Bucket": bucket, "Key": full_key},
                 ExpiresIn=expires_hours * 3600,
             )
-        except ClientError as e:
+        except providers.ClientError as e:
             code = e.response["Error"]["Code"]
             raise ValueError(f"S3 error [{code}]: {e.response['Error']['Message']}") from e
 
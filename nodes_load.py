@@ -2,7 +2,9 @@
 
 import io as io_stdlib
 import os
+import time
 import logging
+from collections import OrderedDict
 
 import numpy as np
 import torch
@@ -13,10 +15,92 @@ import comfy.utils
 
 from .nodes_profile import S3_PROFILE_TYPE
 from .profile import resolve_default_profile, validate_config
-from .providers import create_s3_client
+from . import providers
+from .providers import get_cached_client
 
 logger = logging.getLogger(__name__)
 
+# How long a validated .s3etag sidecar is trusted before re-checking S3.
+# Trades a little freshness for skipping a HEAD round trip per model load.
+ETAG_TTL_SECONDS = 300
+
+# Small LRU of decoded images keyed by object key. Paired with
+# If-None-Match conditional GETs so re-runs of an unchanged workflow
+# skip the body download entirely (S3 answers 304).
+_IMAGE_CACHE: OrderedDict = OrderedDict()
+_IMAGE_CACHE_SIZE = 8
+
+# Models at least this large go through the native CRT transfer manager
+# when the optional awscrt/s3transfer[crt] extras are installed.
+CRT_MIN_BYTES = 1024 ** 3
+
+_download_config = None
+
+
+def _crt_download(config: dict, bucket: str, key: str, dest_path: str, progress_callback) -> bool:
+    """Download via the AWS CRT S3 client; returns False if unavailable.
+
+    The CRT manager runs the transfer in native code with its own event
+    loop and connection pool, so multi-GB downloads are not throttled by
+    the GIL the way the thread-based boto3 path is. Purely optional:
+    callers fall back to download_file when the extras are missing or
+    the transfer fails.
+    """
+    try:
+        import botocore.session
+        from awscrt.auth import AwsCredentialsProvider
+        from s3transfer.crt import (
+            BotocoreCRTRequestSerializer,
+            CRTTransferManager,
+            create_s3_crt_client,
+        )
+        from s3transfer.subscribers import BaseSubscriber
+    except ImportError:
+        return False
+
+    class _Progress(BaseSubscriber):
+        def on_progress(self, future, bytes_transferred, **kwargs):
+            progress_callback(bytes_transferred)
+
+    region = config.get("region") or "us-east-1"
+    try:
+        crt_client = create_s3_crt_client(
+            region=region,
+            crt_credentials_provider=AwsCredentialsProvider.new_static(
+                config.get("access_key", ""), config.get("secret_key", "")
+            ),
+        )
+        serializer = BotocoreCRTRequestSerializer(
+            botocore.session.Session(), {"region_name": region}
+        )
+        with CRTTransferManager(crt_client, serializer) as manager:
+            manager.download(
+                bucket, key, dest_path, subscribers=[_Progress()]
+            ).result()
+        return True
+    except Exception:
+        logger.warning(
+            "CRT download failed, falling back to boto3", exc_info=True
+        )
+        return False
+
+
+def _get_download_config():
+    """TransferConfig that fetches large models as concurrent byte-range GETs.
+
+    Lazy so boto3 is only loaded when a node actually executes.
+    """
+    global _download_config
+    if _download_config is None:
+        from boto3.s3.transfer import TransferConfig
+        _download_config = TransferConfig(
+            multipart_threshold=16 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=16,
+            use_threads=True,
+        )
+    return _download_config
+
 
 class LoadImageFromCloud(io.ComfyNode):
     @classmethod
@@ -47,52 +131,82 @@ class LoadImageFromCloud(io.ComfyNode):
 
     @classmethod
     def execute(cls, key, profile=None) -> io.NodeOutput:
-        from botocore.exceptions import ClientError
-
         config = profile or resolve_default_profile()
         validate_config(config)
-        client = create_s3_client(**config)
+        client = get_cached_client(config)
         bucket = config["bucket"]
 
         # Prepend path_prefix if set
         full_key = f"{config.get('path_prefix', '')}{key}" if not key.startswith("/") else key
 
+        cached = _IMAGE_CACHE.get(full_key)
+        get_kwargs = {"Bucket": bucket, "Key": full_key}
+        if cached is not None:
+            get_kwargs["IfNoneMatch"] = cached[0]
+
         try:
-            response = client.get_object(Bucket=bucket, Key=full_key)
-        except ClientError as e:
+            response = client.get_object(**get_kwargs)
+        except providers.ClientError as e:
             code = e.response["Error"]["Code"]
+            if cached is not None and code in ("304", "NotModified"):
+                _IMAGE_CACHE.move_to_end(full_key)
+                return io.NodeOutput(cached[1], cached[2])
             if code == "NoSuchKey":
                 raise ValueError(f"Object not found: s3://{bucket}/{full_key}") from e
             raise ValueError(f"S3 error [{code}]: {e.response['Error']['Message']}") from e
 
-        image_data = response["Body"].read()
-        img = Image.open(io_stdlib.BytesIO(image_data))
+        # PIL needs a seekable file, so the non-seekable StreamingBody
+        # can't be decoded in-flight. Read it in one buffered pass;
+        # BytesIO over the bytes shares the buffer (copy-on-write), so
+        # only a single copy of the encoded image is ever held.
+        img = Image.open(io_stdlib.BytesIO(response["Body"].read()))
         img = ImageOps.exif_transpose(img)
 
         if img.mode == "I":
             img = img.point(lambda i: i * (1 / 255))
 
-        image_rgb = img.convert("RGB")
-        image_np = np.array(image_rgb).astype(np.float32) / 255.0
-        image_tensor = torch.from_numpy(image_np)[None,]
+        # convert("RGB") converts even when the image is already RGB(A);
+        # only exotic modes (P, L, CMYK, I, ...) need it. np.array makes
+        # a writable uint8 copy - torch.from_numpy can't take PIL's
+        # read-only buffer, and uint8 is 4x smaller than the float32
+        # intermediate this path avoids.
+        if img.mode == "RGB":
+            arr = np.array(img)
+        elif img.mode == "RGBA":
+            arr = np.array(img)[:, :, :3]
+        else:
+            arr = np.array(img.convert("RGB"))
+
+        # Convert uint8 -> float32 in torch: one vectorized cast + in-place
+        # divide, with no intermediate float32 NumPy buffer.
+        image_tensor = torch.from_numpy(arr).to(torch.float32).div_(255.0).unsqueeze_(0)
 
         if "A" in img.getbands():
-            mask = np.array(img.getchannel("A")).astype(np.float32) / 255.0
-            mask = 1.0 - torch.from_numpy(mask)
+            alpha = np.array(img.getchannel("A"))
+            mask = 1.0 - torch.from_numpy(alpha).to(torch.float32).div_(255.0)
         else:
             mask = torch.zeros(
-                (image_np.shape[0], image_np.shape[1]),
+                (arr.shape[0], arr.shape[1]),
                 dtype=torch.float32,
             )
 
-        return io.NodeOutput(image_tensor, mask.unsqueeze(0))
+        mask = mask.unsqueeze(0)
+
+        etag = response.get("ETag", "")
+        if etag:
+            _IMAGE_CACHE[full_key] = (etag, image_tensor, mask)
+            _IMAGE_CACHE.move_to_end(full_key)
+            while len(_IMAGE_CACHE) > _IMAGE_CACHE_SIZE:
+                _IMAGE_CACHE.popitem(last=False)
+
+        return io.NodeOutput(image_tensor, mask)
 
     @classmethod
     def fingerprint_inputs(cls, key, profile=None):
         """Return S3 ETag so ComfyUI re-executes when the remote object changes."""
         try:
             config = profile or resolve_default_profile()
-            client = create_s3_client(**config)
+            client = get_cached_client(config)
             full_key = f"{config.get('path_prefix', '')}{key}"
             resp = client.head_object(Bucket=config["bucket"], Key=full_key)
             return resp.get("ETag", "")
@@ -143,11 +257,9 @@ class LoadModelFromCloud(io.ComfyNode):
     @classmethod
     def execute(cls, model_type, key, force_redownload=False, profile=None) -> io.NodeOutput:
         import folder_paths
-        from botocore.exceptions import ClientError
-
         config = profile or resolve_default_profile()
         validate_config(config)
-        client = create_s3_client(**config)
+        client = get_cached_client(config)
         bucket = config["bucket"]
         full_key = f"{config.get('path_prefix', '')}{key}"
 
@@ -161,25 +273,34 @@ class LoadModelFromCloud(io.ComfyNode):
         etag_path = local_path + ".s3etag"
 
         # Check cache
-        if os.path.exists(local_path) and not force_redownload:
-            try:
-                remote_head = client.head_object(Bucket=bucket, Key=full_key)
-                remote_etag = remote_head.get("ETag", "")
-                if os.path.exists(etag_path):
-                    with open(etag_path, "r") as f:
-                        cached_etag = f.read().strip()
-                    if cached_etag == remote_etag:
-                        logger.info("Model cached: %s", local_path)
-                        return io.NodeOutput(filename)
-            except ClientError:
-                # Can't verify, but file exists - use it
-                if os.path.exists(local_path):
-                    return io.NodeOutput(filename)
-
-        # Download with progress
+        have_local = os.path.exists(local_path) and not force_redownload
+        cached_etag = ""
+        if have_local and os.path.exists(etag_path):
+            with open(etag_path, "r") as f:
+                cached_etag = f.read().strip()
+            # Recently validated sidecar: trust the local copy and skip
+            # the HEAD round trip entirely.
+            if cached_etag and time.time() - os.path.getmtime(etag_path) < ETAG_TTL_SECONDS:
+                logger.info("Model cached: %s", local_path)
+                return io.NodeOutput(filename)
+
+        # One HEAD serves both cache validation and download sizing. With
+        # a cached ETag it is made conditional, so S3 itself answers 304
+        # for an unchanged object and no comparison round trip is needed.
+        head_kwargs = {"Bucket": bucket, "Key": full_key}
+        if have_local and cached_etag:
+            head_kwargs["IfNoneMatch"] = cached_etag
         try:
-            head = client.head_object(Bucket=bucket, Key=full_key)
-        except ClientError as e:
+            head = client.head_object(**head_kwargs)
+        except providers.ClientError as e:
+            if have_local:
+                if e.response["Error"]["Code"] in ("304", "NotModified"):
+                    # Restart the TTL window so the next load skips the HEAD
+                    os.utime(etag_path)
+                    logger.info("Model cached: %s", local_path)
+                    return io.NodeOutput(filename)
+                # Can't verify, but file exists - use it
+                return io.NodeOutput(filename)
             code = e.response["Error"]["Code"]
             if code in ("NoSuchKey", "404"):
                 raise ValueError(f"Model not found: s3://{bucket}/{full_key}") from e
@@ -188,6 +309,12 @@ class LoadModelFromCloud(io.ComfyNode):
         file_size = head["ContentLength"]
         remote_etag = head.get("ETag", "")
 
+        if have_local and cached_etag and cached_etag == remote_etag:
+            # Restart the TTL window so the next load skips the HEAD
+            os.utime(etag_path)
+            logger.info("Model cached: %s", local_path)
+            return io.NodeOutput(filename)
+
         logger.info(
             "Downloading %s (%.2f GB) from s3://%s/%s",
             filename, file_size / (1024**3), bucket, full_key,
@@ -205,10 +332,20 @@ class LoadModelFromCloud(io.ComfyNode):
             pbar.update_absolute(downloaded, file_size)
 
         try:
-            client.download_file(
-                bucket, full_key, temp_path,
-                Callback=progress_callback,
+            # CRT only derives AWS endpoints, so keep it off for the
+            # S3-compatible providers.
+            used_crt = (
+                file_size >= CRT_MIN_BYTES
+                and config.get("provider", "AWS S3") == "AWS S3"
+                and not config.get("endpoint_url")
+                and _crt_download(config, bucket, full_key, temp_path, progress_callback)
             )
+            if not used_crt:
+                client.download_file(
+                    bucket, full_key, temp_path,
+                    Config=_get_download_config(),
+                    Callback=progress_callback,
+                )
             os.replace(temp_path, local_path)
         except Exception:
             if os.path.exists(temp_path):
@@ -3,8 +3,10 @@
 import io as io_stdlib
 import json
 import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import numpy as np
+import torch
 from PIL import Image
 from PIL.PngImagePlugin import PngInfo
 
@@ -13,62 +15,136 @@ from comfy.cli_args import args
 
 from .nodes_profile import S3_PROFILE_TYPE
 from .profile import resolve_default_profile, validate_config
-from .providers import create_s3_client
+from . import providers
+from .providers import get_cached_client
 
 logger = logging.getLogger(__name__)
 
+# Optional fast PNG encoder (SIMD libspng). Only usable when no PNG text
+# metadata needs to be embedded; otherwise we fall back to Pillow.
+try:
+    import pyspng
+    _HAVE_PYSPNG = hasattr(pyspng, "encode")
+except ImportError:
+    _HAVE_PYSPNG = False
+
 MIME_TYPES = {
     "png": "image/png",
     "jpg": "image/jpeg",
     "webp": "image/webp",
 }
 
+_transfer_config = None
+
 
-def _tensor_to_image_bytes(
+def _get_transfer_config():
+    """Shared TransferConfig so large payloads upload as concurrent 8 MB parts.
+
+    Lazy so boto3 is only loaded when a node actually executes.
+    """
+    global _transfer_config
+    if _transfer_config is None:
+        from boto3.s3.transfer import TransferConfig
+        _transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=8,
+        )
+    return _transfer_config
+
+
+def _build_pnginfo(prompt=None, extra_pnginfo=None, disable_metadata=None):
+    """Serialize prompt/workflow metadata into a PngInfo, or None if disabled.
+
+    Built once per batch - json.dumps of a large prompt is pure duplicate
+    work when repeated per image. disable_metadata=None means read the
+    global args flag; passing a bool skips that module lookup.
+    """
+    if disable_metadata is None:
+        disable_metadata = args.disable_metadata
+    if disable_metadata:
+        return None
+    metadata = PngInfo()
+    if prompt is not None:
+        metadata.add_text("prompt", json.dumps(prompt))
+    if extra_pnginfo is not None:
+        for k in extra_pnginfo:
+            metadata.add_text(k, json.dumps(extra_pnginfo[k]))
+    return metadata
+
+
+def _tensor_to_image_buffer(
     image_tensor,
     fmt="png",
     quality=95,
+    compress_level=4,
     prompt=None,
     extra_pnginfo=None,
-) -> bytes:
-    """Convert a single image tensor to bytes in the specified format."""
-    i = 255.0 * image_tensor.cpu().numpy()
-    img = Image.fromarray(np.clip(i, 0, 255).astype(np.uint8))
+    pnginfo=None,
+    disable_metadata=None,
+) -> io_stdlib.BytesIO:
+    """Encode a single image tensor into a BytesIO positioned at 0.
+
+    Returning the buffer (rather than bytes) lets callers hand it
+    straight to upload_fileobj without a final getvalue() copy of the
+    encoded image.
+    """
+    # Quantize to uint8 on the tensor's device so any device-to-host copy
+    # moves 1 byte per channel instead of a float32.
+    i = image_tensor.mul(255.0).clamp_(0.0, 255.0).to(torch.uint8).cpu().numpy()
+    img = Image.fromarray(i)
 
     buf = io_stdlib.BytesIO()
     save_kwargs = {}
 
     if fmt == "png":
-        metadata = None
-        if not args.disable_metadata:
-            metadata = PngInfo()
-            if prompt is not None:
-                metadata.add_text("prompt", json.dumps(prompt))
-            if extra_pnginfo is not None:
-                for k in extra_pnginfo:
-                    metadata.add_text(k, json.dumps(extra_pnginfo[k]))
+        metadata = (
+            pnginfo
+            if pnginfo is not None
+            else _build_pnginfo(prompt, extra_pnginfo, disable_metadata)
+        )
+        if metadata is None and _HAVE_PYSPNG:
+            # BytesIO shares the encoded buffer copy-on-write
+            return io_stdlib.BytesIO(pyspng.encode(i, compress_level=compress_level))
         save_kwargs["pnginfo"] = metadata
-        save_kwargs["compress_level"] = 4
+        save_kwargs["compress_level"] = compress_level
         img.save(buf, format="PNG", **save_kwargs)
     elif fmt == "jpg":
         img.save(buf, format="JPEG", quality=quality)
     elif fmt == "webp":
         img.save(buf, format="WEBP", quality=quality)
 
-    return buf.getvalue()
+    buf.seek(0)
+    return buf
+
+
+def _tensor_to_image_bytes(image_tensor, **kwargs) -> bytes:
+    """Convert a single image tensor to bytes in the specified format."""
+    return _tensor_to_image_buffer(image_tensor, **kwargs).getvalue()
+
+
+def _compile_key_template(config: dict, prefix: str, filename: str, ext: str):
+    """Precompile the S3 object key template into a batch_idx -> key callable.
+
+    The prefix/filename/extension parts are constant across a batch, so
+    join them once; a template without %batch_num% collapses to returning
+    the same string for every image.
+    """
+    template = f"{config.get('path_prefix', '')}{prefix}{filename}.{ext}"
+    if "%batch_num%" not in template:
+        return lambda batch_idx: template
+    parts = template.split("%batch_num%")
+    return lambda batch_idx: str(batch_idx).join(parts)
 
 
 def _build_key(config: dict, prefix: str, filename: str, batch_idx: int, ext: str) -> str:
     """Build the full S3 object key."""
-    base_prefix = config.get("path_prefix", "")
-    name = filename.replace("%batch_num%", str(batch_idx))
-    return f"{base_prefix}{prefix}{name}.{ext}"
+    return _compile_key_template(config, prefix, filename, ext)(batch_idx)
 
 
 def _s3_error_message(e) -> str:
     """Extract a user-friendly message from a botocore ClientError."""
-    from botocore.exceptions import ClientError
-    if isinstance(e, ClientError):
+    if isinstance(e, providers.ClientError):
         code = e.response["Error"]["Code"]
         msg = e.response["Error"]["Message"]
         if code == "NoSuchBucket":
@@ -110,6 +186,13 @@ class SaveImageToCloud(io.ComfyNode):
                     max=100,
                     tooltip="JPEG/WebP quality (ignored for PNG).",
                 ),
+                io.Int.Input(
+                    "compress_level",
+                    default=4,
+                    min=0,
+                    max=9,
+                    tooltip="PNG compression level: 1=fastest, 4=balanced, 9=smallest (ignored for JPEG/WebP).",
+                ),
                 io.Custom(S3_PROFILE_TYPE).Input(
                     "profile",
                     optional=True,
@@ -128,40 +211,56 @@ class SaveImageToCloud(io.ComfyNode):
         filename="ComfyUI_%batch_num%",
         format="png",
         quality=95,
+        compress_level=4,
         profile=None,
     ) -> io.NodeOutput:
-        from botocore.exceptions import ClientError
-
         config = profile or resolve_default_profile()
         validate_config(config)
-        client = create_s3_client(**config)
+        client = get_cached_client(config)
         bucket = config["bucket"]
 
-        uploaded = []
-        for batch_idx, image_tensor in enumerate(images):
-            img_bytes = _tensor_to_image_bytes(
+        content_type = MIME_TYPES.get(format, "application/octet-stream")
+        # Serialize the metadata once; PngInfo is read-only at save time
+        # so sharing it across the upload workers is safe.
+        pnginfo = _build_pnginfo(cls.hidden.prompt, cls.hidden.extra_pnginfo)
+        build_key = _compile_key_template(config, key_prefix, filename, format)
+
+        def _upload_one(batch_idx, image_tensor):
+            buf = _tensor_to_image_buffer(
                 image_tensor,
                 fmt=format,
                 quality=quality,
-                prompt=cls.hidden.prompt,
-                extra_pnginfo=cls.hidden.extra_pnginfo,
+                compress_level=compress_level,
+                pnginfo=pnginfo,
             )
-            key = _build_key(config, key_prefix, filename, batch_idx, format)
-            content_type = MIME_TYPES.get(format, "application/octet-stream")
-
+            size = buf.getbuffer().nbytes
+            key = build_key(batch_idx)
+            client.upload_fileobj(
+                buf,
+                bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
+                Config=_get_transfer_config(),
+            )
+            logger.info("Uploaded %s (%d bytes)", key, size)
+            return f"s3://{bucket}/{key}"
+
+        # Uploads are latency-bound, so run the batch concurrently. boto3
+        # clients are thread-safe for data-plane calls.
+        uploaded = [None] * len(images)
+        with ThreadPoolExecutor(max_workers=min(16, len(images)) or 1) as pool:
+            futures = {
+                pool.submit(_upload_one, batch_idx, image_tensor): batch_idx
+                for batch_idx, image_tensor in enumerate(images)
+            }
             try:
-                client.put_object(
-                    Bucket=bucket,
-                    Key=key,
-                    Body=img_bytes,
-                    ContentType=content_type,
-                )
-            except ClientError as e:
+                for future in as_completed(futures):
+                    uploaded[futures[future]] = future.result()
+            except providers.ClientError as e:
+                for future in futures:
+                    future.cancel()
                 raise ValueError(_s3_error_message(e)) from e
 
-            uploaded.append(f"s3://{bucket}/{key}")
-            logger.info("Uploaded %s (%d bytes)", key, len(img_bytes))
-
         return io.NodeOutput(ui={"text": uploaded})
 
 
@@ -189,15 +288,13 @@ class SaveVideoToCloud(io.ComfyNode):
 
     @classmethod
     def execute(cls, video, key_prefix, filename, format, codec, profile=None) -> io.NodeOutput:
-        from botocore.exceptions import ClientError
         from comfy_api.latest import Types
 
         config = profile or resolve_default_profile()
         validate_config(config)
-        client = create_s3_client(**config)
+        client = get_cached_client(config)
         bucket = config["bucket"]
 
-        buf = io_stdlib.BytesIO()
         saved_metadata = None
         if not args.disable_metadata:
             metadata = {}
@@ -208,22 +305,27 @@ class SaveVideoToCloud(io.ComfyNode):
             if metadata:
                 saved_metadata = metadata
 
-        video.save_to(
-            buf,
-            format=Types.VideoContainer(format),
-            codec=codec,
-            metadata=saved_metadata,
-        )
-        buf.seek(0)
-
         ext = Types.VideoContainer.get_extension(format)
         base_prefix = config.get("path_prefix", "")
         key = f"{base_prefix}{key_prefix}{filename}.{ext}"
 
-        try:
-            client.upload_fileobj(buf, bucket, key)
-        except ClientError as e:
-            raise ValueError(_s3_error_message(e)) from e
+        # Spool the encoded video: clips under 8 MB stay in memory,
+        # larger ones roll over to a temp file so peak RSS no longer
+        # scales with video size. (Container muxers need a seekable
+        # target to finalize headers, so a raw pipe is not an option.)
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as buf:
+            video.save_to(
+                buf,
+                format=Types.VideoContainer(format),
+                codec=codec,
+                metadata=saved_metadata,
+            )
+            buf.seek(0)
+
+            try:
+                client.upload_fileobj(buf, bucket, key, Config=_get_transfer_config())
+            except providers.ClientError as e:
+                raise ValueError(_s3_error_message(e)) from e
 
         logger.info("Uploaded video %s", key)
         return io.NodeOutput(ui={"text": [f"s3://{bucket}/{key}"]})
@@ -251,12 +353,11 @@ class SaveAudioToCloud(io.ComfyNode):
 
     @classmethod
     def execute(cls, audio, key_prefix, filename, format, profile=None) -> io.NodeOutput:
-        from botocore.exceptions import ClientError
         import torchaudio
 
         config = profile or resolve_default_profile()
         validate_config(config)
-        client = create_s3_client(**config)
+        client = get_cached_client(config)
         bucket = config["bucket"]
 
         buf = io_stdlib.BytesIO()
@@ -271,13 +372,14 @@ class SaveAudioToCloud(io.ComfyNode):
         key = f"{base_prefix}{key_prefix}{filename}.{format}"
 
         try:
-            client.put_object(
-                Bucket=bucket,
-                Key=key,
-                Body=buf.getvalue(),
-                ContentType=mime_types.get(format, "application/octet-stream"),
+            client.upload_fileobj(
+                buf,
+                bucket,
+                key,
+                ExtraArgs={"ContentType": mime_types.get(format, "application/octet-stream")},
+                Config=_get_transfer_config(),
             )
-        except ClientError as e:
+        except providers.ClientError as e:
             raise ValueError(_s3_error_message(e)) from e
 
         logger.info("Uploaded audio %s", key)
@@ -10,9 +10,17 @@ Credentials are resolved in layers:
 import os
 import json
 import logging
+import functools
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # stdlib json parses bytes directly since 3.6, just slower
+    _json_loads = json.loads
+
 ENV_PREFIX = "COMFY_S3_"
 
 # Map of env var suffix -> profile dict key
@@ -27,45 +35,108 @@ ENV_KEYS = {
     "PATH_PREFIX": "path_prefix",
 }
 
+# Fully-expanded env var names, precomputed so per-resolution scans skip
+# the string formatting.
+_ENV_LOOKUPS: tuple[tuple[str, str], ...] = tuple(
+    (ENV_PREFIX + suffix, key) for suffix, key in ENV_KEYS.items()
+)
+
+
+# Probed once at import: inside ComfyUI folder_paths is always there,
+# so don't re-run the import machinery (and a broad except) per lookup.
+try:
+    from folder_paths import get_system_user_directory as _get_system_user_directory
+except ImportError:
+    _get_system_user_directory = None
+
 
+@functools.lru_cache(maxsize=1)
 def _get_profiles_path() -> str:
-    """Get path to the profiles JSON file in ComfyUI's system user directory."""
-    try:
-        import folder_paths
-        sys_dir = folder_paths.get_system_user_directory("cloud_storage")
-        return os.path.join(sys_dir, "profiles.json")
-    except (ImportError, Exception):
-        # Fallback for testing outside ComfyUI
-        return os.path.join(os.path.expanduser("~"), ".comfyui-cloud-storage", "profiles.json")
+    """Get path to the profiles JSON file in ComfyUI's system user directory.
+
+    Cached for the process lifetime - the system user directory never
+    moves once ComfyUI is running.
+    """
+    if _get_system_user_directory is not None:
+        try:
+            sys_dir = _get_system_user_directory("cloud_storage")
+            return os.path.join(sys_dir, "profiles.json")
+        except Exception:
+            pass
+    # Fallback for testing outside ComfyUI
+    return os.path.join(os.path.expanduser("~"), ".comfyui-cloud-storage", "profiles.json")
+
+
+# Parsed profiles keyed by (path, mtime_ns, size) - at most one entry,
+# re-parsed only when the file actually changes.
+_PROFILES_CACHE: dict[tuple, dict] = {}
 
 
 def _load_profiles() -> dict:
-    """Load named profiles from the JSON file."""
+    """Load named profiles from the JSON file.
+
+    The parse result is cached against the file's mtime and size, so
+    per-save profile resolutions skip the disk read and JSON decode.
+    """
     path = _get_profiles_path()
-    if not os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        # Missing file; one stat covers the old exists() + open dance
         return {}
+
+    cache_key = (path, st.st_mtime_ns, st.st_size)
+    cached = _PROFILES_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
-        return data.get("profiles", {})
-    except (json.JSONDecodeError, OSError) as e:
+        # Binary read skips the TextIOWrapper decode; both orjson and
+        # stdlib json parse the raw bytes. Decode errors from either
+        # are ValueError subclasses.
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
+    except (ValueError, OSError) as e:
         logger.warning("Failed to load cloud storage profiles from %s: %s", path, e)
         return {}
 
+    profiles = data.get("profiles", {})
+    _PROFILES_CACHE.clear()
+    _PROFILES_CACHE[cache_key] = profiles
+    return profiles
+
+
+# Name tuples keyed like _PROFILES_CACHE. ComfyUI fetches the node list
+# (and with it these names) on every refresh, so avoid rebuilding.
+_NAMES_CACHE: dict[tuple, tuple[str, ...]] = {}
+
+
+def load_profile_names() -> tuple[str, ...]:
+    """Return the available named profile names.
+
+    Memoized against the profiles file's stat signature; a tuple so
+    callers can't mutate the cached value.
+    """
+    path = _get_profiles_path()
+    try:
+        st = os.stat(path)
+    except OSError:
+        # No profiles file; nothing worth caching
+        return tuple(_load_profiles().keys())
 
-def load_profile_names() -> list[str]:
-    """Return list of available named profile names."""
-    return list(_load_profiles().keys())
+    cache_key = (path, st.st_mtime_ns, st.st_size)
+    names = _NAMES_CACHE.get(cache_key)
+    if names is None:
+        names = tuple(_load_profiles().keys())
+        _NAMES_CACHE.clear()
+        _NAMES_CACHE[cache_key] = names
+    return names
 
 
 def _profile_from_env() -> dict:
     """Build a profile dict from environment variables."""
-    profile = {}
-    for env_suffix, key in ENV_KEYS.items():
-        val = os.environ.get(f"{ENV_PREFIX}{env_suffix}", "")
-        if val:
-            profile[key] = val
-    return profile
+    env = os.environ
+    return {key: val for name, key in _ENV_LOOKUPS if (val := env.get(name))}
 
 
 def resolve_profile(
@@ -82,18 +153,16 @@ def resolve_profile(
         provider, access_key, secret_key, region, bucket,
         endpoint_url, account_id, path_prefix
     """
-    # Start with env vars
-    config = {
-        "provider": "AWS S3",
-        "access_key": "",
-        "secret_key": "",
-        "region": "",
-        "bucket": "",
-        "endpoint_url": "",
-        "account_id": "",
-        "path_prefix": "",
-    }
-    config.update({k: v for k, v in _profile_from_env().items() if v})
+    no_overrides = (
+        not provider_override and not bucket_override and not path_prefix_override
+    )
+    # Common case: default sentinel, nothing to overlay - hand back the
+    # memoized env-vars profile without running the update passes.
+    if no_overrides and profile_name in ("(env vars)", "", None):
+        return resolve_default_profile()
+
+    # Start with env vars (copied from the memoized default)
+    config = dict(resolve_default_profile())
 
     # Overlay named profile
     if profile_name and profile_name != "(env vars)":
@@ -102,7 +171,9 @@ def resolve_profile(
         if not named:
             logger.warning("Cloud storage profile '%s' not found", profile_name)
         else:
-            config.update({k: v for k, v in named.items() if v})
+            for k, v in named.items():
+                if v:
+                    config[k] = v
 
     # Overlay per-node widget overrides (never override credentials this way)
     if provider_override and provider_override != "(from profile)":
@@ -115,13 +186,46 @@ def resolve_profile(
     return config
 
 
+@functools.cache
 def resolve_default_profile() -> dict:
-    """Resolve the default profile (env vars only, no named profile)."""
-    return resolve_profile("(env vars)")
+    """Resolve the default profile (env vars only, no named profile).
+
+    Cached for the process lifetime - env vars don't change under a
+    running ComfyUI, and this runs on every node execution that has no
+    profile connected. The shared dict must be treated as read-only;
+    all current callers only read from it.
+    """
+    config = {
+        "provider": "AWS S3",
+        "access_key": "",
+        "secret_key": "",
+        "region": "",
+        "bucket": "",
+        "endpoint_url": "",
+        "account_id": "",
+        "path_prefix": "",
+    }
+    env = os.environ
+    for name, key in _ENV_LOOKUPS:
+        if val := env.get(name):
+            config[key] = val
+    return config
+
+
+# Config dicts already accepted by validate_config, keyed by id. Values
+# hold a strong reference so a recycled id can never alias a new dict.
+_VALIDATED_CONFIGS: dict[int, dict] = {}
 
 
 def validate_config(config: dict) -> None:
-    """Raise ValueError with a clear message if required fields are missing."""
+    """Raise ValueError with a clear message if required fields are missing.
+
+    Validation is memoized per config object - profiles are resolved once
+    and then re-checked on every node execution, so repeat calls with the
+    same dict return immediately.
+    """
+    if _VALIDATED_CONFIGS.get(id(config)) is config:
+        return
     if not config.get("access_key"):
         raise ValueError(
             "Cloud storage access key not configured. "
@@ -138,3 +242,6 @@ def validate_config(config: dict) -> None:
             "Cloud storage bucket not configured. "
             "Set COMFY_S3_BUCKET env var or configure a profile."
         )
+    if len(_VALIDATED_CONFIGS) > 64:
+        _VALIDATED_CONFIGS.clear()
+    _VALIDATED_CONFIGS[id(config)] = config
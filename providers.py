@@ -5,7 +5,21 @@ Supports: AWS S3, Backblaze B2, Cloudflare R2, MinIO, Wasabi,
 DigitalOcean Spaces, GCS (S3 interop), and any custom S3 endpoint.
 """
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+def __getattr__(name):
+    """Lazily expose botocore symbols so importing the node modules at
+    ComfyUI startup doesn't pull in the botocore tree (~300 ms). The
+    resolved class is cached in module globals on first access.
+    """
+    if name == "ClientError":
+        from botocore.exceptions import ClientError
+        globals()["ClientError"] = ClientError
+        return ClientError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass(frozen=True)
@@ -13,6 +27,24 @@ class ProviderPreset:
     endpoint_template: str  # "" means boto3 default (AWS), else "{region}" placeholders
     default_region: str = "us-east-1"
     force_path_style: bool = False
+    # Precompiled endpoint builder: (region, account_id) -> url.
+    # str.replace on a short literal skips str.format's mini-language
+    # parsing on every client build.
+    _endpoint_fn: Callable[[str, str], str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        template = self.endpoint_template
+        if not template:
+            fn = lambda region, account_id: ""
+        elif "{account_id}" in template:
+            fn = lambda region, account_id, t=template: (
+                t.replace("{region}", region).replace("{account_id}", account_id)
+            )
+        elif "{region}" in template:
+            fn = lambda region, account_id, t=template: t.replace("{region}", region)
+        else:
+            fn = lambda region, account_id, t=template: t
+        object.__setattr__(self, "_endpoint_fn", fn)
 
 
 PROVIDERS: dict[str, ProviderPreset] = {
@@ -53,6 +85,45 @@ PROVIDERS: dict[str, ProviderPreset] = {
 
 PROVIDER_NAMES = list(PROVIDERS.keys())
 
+# Fallback preset, hoisted so the hit path of PROVIDERS.get doesn't pay
+# for an extra lookup it never uses.
+_CUSTOM_PRESET = PROVIDERS["Custom"]
+
+
+@functools.lru_cache(maxsize=8)
+def _get_config(force_path_style: bool):
+    """Shared botocore Config per addressing style.
+
+    Config objects are immutable once built and safe to share between
+    clients, so there is no reason to rebuild one per client.
+    """
+    from botocore.config import Config
+
+    config_kwargs = {
+        "signature_version": "s3v4",
+        "s3": {
+            "addressing_style": "path" if force_path_style else "auto",
+            # Skip the SigV4 payload hash - one full SHA-256 pass over
+            # every uploaded byte; TLS already covers transport integrity.
+            "payload_signing_enabled": False,
+        },
+        "retries": {"max_attempts": 3, "mode": "adaptive"},
+        "max_pool_connections": 32,
+        # Keep pooled connections alive between workflow runs so
+        # NATs/load balancers don't silently drop idle entries.
+        "tcp_keepalive": True,
+        "connect_timeout": 3,
+        "read_timeout": 60,
+        "user_agent_extra": "b2ai-comfyui",
+    }
+    try:
+        # Only compute request checksums where S3 demands them, instead
+        # of CRC32-ing every uploaded byte (botocore >= 1.36 default).
+        return Config(request_checksum_calculation="when_required", **config_kwargs)
+    except TypeError:
+        # Older botocore: no default upload checksums to switch off
+        return Config(**config_kwargs)
+
 
 def create_s3_client(
     provider: str = "AWS S3",
@@ -65,36 +136,77 @@ def create_s3_client(
     """Create a boto3 S3 client configured for the given provider.
 
     Uses lazy import so boto3 is only loaded when actually needed.
+    (A bare botocore client would import slightly less, but the save and
+    load nodes depend on boto3's injected transfer methods -
+    upload_fileobj / download_file - so boto3 it is.)
     """
     import boto3
-    from botocore.config import Config
 
-    preset = PROVIDERS.get(provider, PROVIDERS["Custom"])
+    preset = PROVIDERS.get(provider, _CUSTOM_PRESET)
     effective_region = region or preset.default_region
 
     # Resolve endpoint: explicit override > preset template
     if endpoint_url:
         effective_endpoint = endpoint_url
-    elif preset.endpoint_template:
-        effective_endpoint = preset.endpoint_template.format(
-            region=effective_region,
-            account_id=account_id,
-        )
     else:
-        effective_endpoint = ""
+        effective_endpoint = preset._endpoint_fn(effective_region, account_id)
 
     kwargs = {
         "aws_access_key_id": access_key,
         "aws_secret_access_key": secret_key,
         "region_name": effective_region,
-        "config": Config(
-            signature_version="s3v4",
-            s3={"addressing_style": "path" if preset.force_path_style else "auto"},
-            retries={"max_attempts": 3, "mode": "adaptive"},
-            user_agent_extra="b2ai-comfyui",
-        ),
+        "config": _get_config(preset.force_path_style),
     }
     if effective_endpoint:
         kwargs["endpoint_url"] = effective_endpoint
 
     return boto3.client("s3", **kwargs)
+
+
+_CLIENT_CACHE: dict[tuple, object] = {}
+
+
+def _client_cache_key(config: dict) -> tuple:
+    """Hashable cache key for a resolved profile config.
+
+    The secret key is hashed so raw credentials are not retained as
+    dict keys.
+    """
+    import hashlib
+
+    return (
+        config.get("provider", ""),
+        config.get("access_key", ""),
+        hashlib.blake2b(
+            config.get("secret_key", "").encode(),
+            digest_size=8,
+            usedforsecurity=False,
+        ).hexdigest(),
+        config.get("region", ""),
+        config.get("endpoint_url", ""),
+        config.get("account_id", ""),
+    )
+
+
+def get_cached_client(config: dict):
+    """Return a (cached) boto3 S3 client for a resolved profile config.
+
+    Building a client per node execution re-resolves credentials and
+    throws away the keep-alive connection pool, costing TLS handshake
+    round trips on every operation. Clients are thread-safe for
+    data-plane calls, so one instance per profile serves concurrent
+    executions.
+    """
+    key = _client_cache_key(config)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = create_s3_client(
+            provider=config.get("provider", "AWS S3"),
+            access_key=config.get("access_key", ""),
+            secret_key=config.get("secret_key", ""),
+            region=config.get("region", ""),
+            endpoint_url=config.get("endpoint_url", ""),
+            account_id=config.get("account_id", ""),
+        )
+        _CLIENT_CACHE[key] = client
+    return client
@@ -3,63 +3,80 @@
 import sys
 import importlib
 from pathlib import Path
-from unittest.mock import MagicMock
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
+
+
+def _stub(name):
+    """Cheap placeholder for attributes the tests never call through."""
+    return type(name, (), {})
 
 
 def _setup_comfy_mocks():
-    """Set up minimal ComfyUI mocks for unit testing outside ComfyUI."""
+    """Set up minimal ComfyUI stubs for unit testing outside ComfyUI.
+
+    Plain classes and namespaces rather than MagicMock: the node modules
+    only touch these at import time (base classes and annotations), and
+    every MagicMock allocates a child-mock graph that each pytest
+    invocation pays for during collection.
+    """
     if "comfy_api" in sys.modules:
         return
 
-    # Mock comfy_api.latest.io
-    mock_io = MagicMock()
-    mock_io.ComfyNode = type("ComfyNode", (), {
-        "define_schema": classmethod(lambda cls: None),
-        "execute": classmethod(lambda cls, **kw: None),
-        "hidden": MagicMock(),
-    })
-    mock_io.Schema = MagicMock
-    mock_io.NodeOutput = lambda *args, **kwargs: {"result": args, "ui": kwargs.get("ui")}
-    mock_io.Image = MagicMock()
-    mock_io.Video = MagicMock()
-    mock_io.Audio = MagicMock()
-    mock_io.Mask = MagicMock()
-    mock_io.String = MagicMock()
-    mock_io.Int = MagicMock()
-    mock_io.Float = MagicMock()
-    mock_io.Boolean = MagicMock()
-    mock_io.Combo = MagicMock()
-    mock_io.Custom = MagicMock(return_value=MagicMock())
-    mock_io.Hidden = MagicMock()
-    mock_io.FolderType = MagicMock()
-
-    mock_latest = MagicMock()
+    mock_io = SimpleNamespace(
+        ComfyNode=type("ComfyNode", (), {
+            "define_schema": classmethod(lambda cls: None),
+            "execute": classmethod(lambda cls, **kw: None),
+            "hidden": SimpleNamespace(),
+        }),
+        Schema=_stub("Schema"),
+        NodeOutput=lambda *args, **kwargs: {"result": args, "ui": kwargs.get("ui")},
+        Image=_stub("Image"),
+        Video=_stub("Video"),
+        Audio=_stub("Audio"),
+        Mask=_stub("Mask"),
+        String=_stub("String"),
+        Int=_stub("Int"),
+        Float=_stub("Float"),
+        Boolean=_stub("Boolean"),
+        Combo=_stub("Combo"),
+        Custom=lambda node_type: _stub("CustomIO"),
+        Hidden=_stub("Hidden"),
+        FolderType=_stub("FolderType"),
+    )
+
+    mock_latest = ModuleType("comfy_api.latest")
     mock_latest.io = mock_io
     mock_latest.ComfyExtension = type("ComfyExtension", (), {})
-    mock_latest.ui = MagicMock()
-    mock_latest.Input = MagicMock()
-    mock_latest.Types = MagicMock()
+    mock_latest.ui = SimpleNamespace()
+    mock_latest.Input = _stub("Input")
+    mock_latest.Types = SimpleNamespace()
 
-    sys.modules["comfy_api"] = MagicMock(latest=mock_latest)
+    mock_comfy_api = ModuleType("comfy_api")
+    mock_comfy_api.latest = mock_latest
+    sys.modules["comfy_api"] = mock_comfy_api
     sys.modules["comfy_api.latest"] = mock_latest
 
     # Mock comfy core
-    mock_args = MagicMock()
-    mock_args.disable_metadata = False
-    mock_cli_args = MagicMock(args=mock_args)
+    mock_cli_args = ModuleType("comfy.cli_args")
+    mock_cli_args.args = SimpleNamespace(disable_metadata=False)
 
-    mock_utils = MagicMock()
-    mock_utils.ProgressBar = MagicMock()
+    mock_utils = ModuleType("comfy.utils")
+    mock_utils.ProgressBar = type("ProgressBar", (), {
+        "__init__": lambda self, total: None,
+        "update_absolute": lambda self, value, total=None: None,
+    })
 
-    sys.modules["comfy"] = MagicMock(utils=mock_utils, cli_args=mock_cli_args)
+    mock_comfy = ModuleType("comfy")
+    mock_comfy.utils = mock_utils
+    mock_comfy.cli_args = mock_cli_args
+    sys.modules["comfy"] = mock_comfy
     sys.modules["comfy.utils"] = mock_utils
     sys.modules["comfy.cli_args"] = mock_cli_args
 
     # Mock folder_paths
-    mock_fp = MagicMock()
-    mock_fp.get_system_user_directory.return_value = "/tmp/comfyui-test/__cloud_storage"
-    mock_fp.get_folder_paths.return_value = ["/tmp/comfyui-test-models"]
+    mock_fp = ModuleType("folder_paths")
+    mock_fp.get_system_user_directory = lambda name: "/tmp/comfyui-test/__cloud_storage"
+    mock_fp.get_folder_paths = lambda model_type: ["/tmp/comfyui-test-models"]
     sys.modules["folder_paths"] = mock_fp
 
 
@@ -72,7 +89,7 @@ sys.path.insert(0, str(pkg_root.parent))  # add oss/ to path
 
 # Create a properly named alias module
 _pkg = importlib.import_module(pkg_root.name.replace("-", "_"), package=None) if pkg_root.name.replace("-", "_") in sys.modules else None
-if _pkg is None:
+if _pkg is None and "comfyui_cloud_storage" not in sys.modules:
     # Load the package from the hyphenated directory via importlib
     spec = importlib.util.spec_from_file_location(
         "comfyui_cloud_storage",
@@ -83,14 +100,17 @@ if _pkg is None:
     sys.modules["comfyui_cloud_storage"] = _pkg
     spec.loader.exec_module(_pkg)
 
-    # Also register submodules
+    # Also register submodules (skipping any already loaded)
     for submod_name in ["providers", "profile", "nodes_profile", "nodes_save", "nodes_load", "nodes_browse"]:
+        full_name = f"comfyui_cloud_storage.{submod_name}"
+        if full_name in sys.modules:
+            continue
         submod_path = pkg_root / f"{submod_name}.py"
         if submod_path.exists():
             sub_spec = importlib.util.spec_from_file_location(
-                f"comfyui_cloud_storage.{submod_name}",
+                full_name,
                 str(submod_path),
             )
             sub_mod = importlib.util.module_from_spec(sub_spec)
-            sys.modules[f"comfyui_cloud_storage.{submod_name}"] = sub_mod
+            sys.modules[full_name] = sub_mod
             sub_spec.loader.exec_module(sub_mod)
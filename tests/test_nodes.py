@@ -18,25 +18,29 @@ class TestTensorToImageBytes:
     def test_png_output(self):
         from comfyui_cloud_storage.nodes_save import _tensor_to_image_bytes
         tensor = _make_image_tensor()[0]  # single image
-        with patch("comfyui_cloud_storage.nodes_save.args") as mock_args:
-            mock_args.disable_metadata = True
-            data = _tensor_to_image_bytes(tensor, fmt="png")
+        data = _tensor_to_image_bytes(tensor, fmt="png", disable_metadata=True)
         assert data[:8] == b"\x89PNG\r\n\x1a\n"  # PNG magic bytes
 
+    def test_png_compress_level(self):
+        from comfyui_cloud_storage.nodes_save import _tensor_to_image_bytes
+        tensor = _make_image_tensor()[0]
+        data = _tensor_to_image_bytes(
+            tensor, fmt="png", compress_level=1, disable_metadata=True
+        )
+        assert data[:8] == b"\x89PNG\r\n\x1a\n"
+
     def test_jpg_output(self):
         from comfyui_cloud_storage.nodes_save import _tensor_to_image_bytes
         tensor = _make_image_tensor()[0]
-        with patch("comfyui_cloud_storage.nodes_save.args") as mock_args:
-            mock_args.disable_metadata = True
-            data = _tensor_to_image_bytes(tensor, fmt="jpg", quality=80)
+        data = _tensor_to_image_bytes(
+            tensor, fmt="jpg", quality=80, disable_metadata=True
+        )
         assert data[:2] == b"\xff\xd8"  # JPEG magic bytes
 
     def test_webp_output(self):
         from comfyui_cloud_storage.nodes_save import _tensor_to_image_bytes
         tensor = _make_image_tensor()[0]
-        with patch("comfyui_cloud_storage.nodes_save.args") as mock_args:
-            mock_args.disable_metadata = True
-            data = _tensor_to_image_bytes(tensor, fmt="webp")
+        data = _tensor_to_image_bytes(tensor, fmt="webp", disable_metadata=True)
         assert data[:4] == b"RIFF"  # WebP magic bytes
 
 
@@ -59,6 +63,13 @@ class TestBuildKey:
         key = _build_key(config, "", "img_%batch_num%_%batch_num%", 5, "png")
         assert key == "img_5_5.png"
 
+    def test_compiled_template_without_placeholder(self):
+        from comfyui_cloud_storage.nodes_save import _compile_key_template
+        build_key = _compile_key_template({"path_prefix": ""}, "images/", "single", "png")
+        # No %batch_num%: every index yields the identical key
+        assert build_key(0) is build_key(7)
+        assert build_key(0) == "images/single.png"
+
 
 class TestS3ErrorMessage:
     def test_no_such_bucket(self):
@@ -6,6 +6,15 @@ import pytest
 from unittest.mock import patch, mock_open
 
 
+@pytest.fixture(autouse=True)
+def _clear_default_profile_cache():
+    """resolve_default_profile caches per process; tests patch env per test."""
+    from comfyui_cloud_storage.profile import resolve_default_profile
+    resolve_default_profile.cache_clear()
+    yield
+    resolve_default_profile.cache_clear()
+
+
 class TestProfileFromEnv:
     @patch.dict(os.environ, {
         "COMFY_S3_PROVIDER": "Backblaze B2",
@@ -129,9 +138,9 @@ class TestLoadProfileNames:
     def test_returns_profile_names(self, _mock):
         from comfyui_cloud_storage.profile import load_profile_names
         names = load_profile_names()
-        assert names == ["default", "production", "staging"]
+        assert names == ("default", "production", "staging")
 
     @patch("comfyui_cloud_storage.profile._load_profiles", return_value={})
     def test_empty_when_no_profiles(self, _mock):
         from comfyui_cloud_storage.profile import load_profile_names
-        assert load_profile_names() == []
+        assert load_profile_names() == ()
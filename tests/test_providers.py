@@ -37,6 +37,12 @@ class TestProviderPresets:
         from comfyui_cloud_storage.providers import PROVIDERS
         assert PROVIDERS["MinIO"].force_path_style is True
 
+    def test_endpoint_fn_matches_template(self):
+        from comfyui_cloud_storage.providers import PROVIDERS
+        for name, preset in PROVIDERS.items():
+            expected = preset.endpoint_template.format(region="r1", account_id="a1")
+            assert preset._endpoint_fn("r1", "a1") == expected, name
+
     def test_non_minio_uses_auto_style(self):
         from comfyui_cloud_storage.providers import PROVIDERS
         for name, preset in PROVIDERS.items():
@@ -45,40 +51,57 @@ class TestProviderPresets:
 
 
 class TestCreateS3Client:
-    def _call_with_mock_boto3(self, **kwargs):
-        """Call create_s3_client with a mocked boto3 and return the mock + call args."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def patched_boto3(cls):
+        """Patch boto3 once for the whole class.
+
+        patch.dict restores sys.modules at teardown, dropping any
+        botocore modules first imported inside the block - clear the
+        shared Config cache so it is rebuilt from the live module.
+        """
         mock_boto3 = MagicMock()
         with patch.dict(sys.modules, {"boto3": mock_boto3}):
-            # Need to re-import to pick up the mock
-            from comfyui_cloud_storage.providers import create_s3_client
+            from comfyui_cloud_storage.providers import _get_config
+            _get_config.cache_clear()
+            yield mock_boto3
+
+    @pytest.fixture
+    def make_client(self, patched_boto3):
+        """Call create_s3_client against the class-wide mock and return it."""
+        from comfyui_cloud_storage.providers import create_s3_client
+        patched_boto3.client.reset_mock()
+
+        def call(**kwargs):
             create_s3_client(**kwargs)
-        return mock_boto3
+            return patched_boto3
+        return call
 
-    def test_aws_no_endpoint_url(self):
-        mock_boto3 = self._call_with_mock_boto3(
+    def test_aws_no_endpoint_url(self, make_client):
+        mock_boto3 = make_client(
             provider="AWS S3", access_key="AKID", secret_key="SECRET",
         )
         call_kwargs = mock_boto3.client.call_args
         assert "endpoint_url" not in call_kwargs.kwargs
 
-    def test_b2_sets_endpoint(self):
-        mock_boto3 = self._call_with_mock_boto3(
+    def test_b2_sets_endpoint(self, make_client):
+        mock_boto3 = make_client(
             provider="Backblaze B2", access_key="AKID", secret_key="SECRET",
             region="eu-central-003",
         )
         call_kwargs = mock_boto3.client.call_args
         assert call_kwargs.kwargs["endpoint_url"] == "https://s3.eu-central-003.backblazeb2.com"
 
-    def test_custom_endpoint_overrides_preset(self):
-        mock_boto3 = self._call_with_mock_boto3(
+    def test_custom_endpoint_overrides_preset(self, make_client):
+        mock_boto3 = make_client(
             provider="Backblaze B2", access_key="AKID", secret_key="SECRET",
             endpoint_url="https://custom.example.com",
         )
         call_kwargs = mock_boto3.client.call_args
         assert call_kwargs.kwargs["endpoint_url"] == "https://custom.example.com"
 
-    def test_credentials_passed_through(self):
-        mock_boto3 = self._call_with_mock_boto3(
+    def test_credentials_passed_through(self, make_client):
+        mock_boto3 = make_client(
             provider="AWS S3", access_key="mykey", secret_key="mysecret",
             region="us-west-2",
         )
@@ -87,19 +110,74 @@ class TestCreateS3Client:
         assert call_kwargs.kwargs["aws_secret_access_key"] == "mysecret"
         assert call_kwargs.kwargs["region_name"] == "us-west-2"
 
-    def test_unknown_provider_uses_custom(self):
-        mock_boto3 = self._call_with_mock_boto3(
+    def test_unknown_provider_uses_custom(self, make_client):
+        mock_boto3 = make_client(
             provider="SomeUnknown", access_key="AKID", secret_key="SECRET",
             endpoint_url="https://unknown.example.com",
         )
         call_kwargs = mock_boto3.client.call_args
         assert call_kwargs.kwargs["endpoint_url"] == "https://unknown.example.com"
 
-    def test_user_agent_set(self):
+    def test_user_agent_set(self, make_client):
         from botocore.config import Config
-        mock_boto3 = self._call_with_mock_boto3(
+        mock_boto3 = make_client(
             provider="Backblaze B2", access_key="AKID", secret_key="SECRET",
         )
         config = mock_boto3.client.call_args.kwargs["config"]
         assert isinstance(config, Config)
         assert config.user_agent_extra == "b2ai-comfyui"
+
+    def test_connection_tuning(self, make_client):
+        mock_boto3 = make_client(
+            provider="AWS S3", access_key="AKID", secret_key="SECRET",
+        )
+        config = mock_boto3.client.call_args.kwargs["config"]
+        assert config.tcp_keepalive is True
+        assert config.max_pool_connections == 32
+
+    def test_payload_signing_disabled(self, make_client):
+        mock_boto3 = make_client(
+            provider="AWS S3", access_key="AKID", secret_key="SECRET",
+        )
+        config = mock_boto3.client.call_args.kwargs["config"]
+        assert config.s3["payload_signing_enabled"] is False
+
+
+class TestGetCachedClient:
+    def _config(self, **overrides):
+        config = {
+            "provider": "Backblaze B2",
+            "access_key": "AKID",
+            "secret_key": "SECRET",
+            "region": "us-west-004",
+            "bucket": "mybucket",
+            "endpoint_url": "",
+            "account_id": "",
+            "path_prefix": "",
+        }
+        config.update(overrides)
+        return config
+
+    def test_same_config_reuses_client(self):
+        mock_boto3 = MagicMock()
+        with patch.dict(sys.modules, {"boto3": mock_boto3}):
+            from comfyui_cloud_storage.providers import get_cached_client, _CLIENT_CACHE
+            _CLIENT_CACHE.clear()
+            first = get_cached_client(self._config())
+            second = get_cached_client(dict(self._config()))
+        assert first is second
+        assert mock_boto3.client.call_count == 1
+
+    def test_different_credentials_build_new_client(self):
+        mock_boto3 = MagicMock()
+        with patch.dict(sys.modules, {"boto3": mock_boto3}):
+            from comfyui_cloud_storage.providers import get_cached_client, _CLIENT_CACHE
+            _CLIENT_CACHE.clear()
+            get_cached_client(self._config())
+            get_cached_client(self._config(access_key="OTHER"))
+        assert mock_boto3.client.call_count == 2
+
+    def test_cache_key_does_not_store_raw_secret(self):
+        from comfyui_cloud_storage.providers import _client_cache_key
+        key = _client_cache_key(self._config())
+        assert "SECRET" not in key